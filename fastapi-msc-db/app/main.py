@@ -2,9 +2,10 @@ from fastapi import FastAPI, Depends, HTTPException
 from sqlalchemy.orm import Session
 import models
 import schemas
-from database import SessionLocal, engine, get_db
+from database import SessionLocal, engine, get_db, init_db
 
 import logging
+import os
 
 
 # Configure root logger
@@ -12,7 +13,9 @@ logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Create the database tables defined in models.py
-models.Base.metadata.create_all(bind=engine)
+# (under gunicorn this already ran once, before the workers booted: see gunicorn.conf.py)
+if not os.getenv("DB_SCHEMA_READY"):
+    init_db()
 
 app = FastAPI()
 
@@ -6,4 +6,7 @@ class Item(Base):
 
     id = Column(Integer, primary_key=True, index=True)
     name = Column(String, index=True)
-    description = Column(String, nullable=True)
\ No newline at end of file
+    description = Column(String, nullable=True)
+    # "<topic>-<partition>-<offset>" of the Kafka record this item was ingested from.
+    # Unique so re-delivered records are upserted instead of duplicated.
+    source = Column(String, unique=True, nullable=True, index=True)
\ No newline at end of file
@@ -0,0 +1,239 @@
+import asyncio
+import json
+import logging
+import time
+from typing import Any, Dict, List
+
+from opentelemetry import metrics, trace
+from opentelemetry.semconv.trace import SpanAttributes
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import DataError, IntegrityError
+from sqlalchemy.orm import Session
+
+import models
+from database import SessionLocal
+from kafka_metrics import MonitoredConsumer, propagator, safe_decode
+
+LOG = logging.getLogger("fastapi-msc-ingest")
+
+# -----------------------------------------------------------
+# OTel setup
+# -----------------------------------------------------------
+tracer = trace.get_tracer(__name__)
+meter = metrics.get_meter("fastapi-msc-ingest")
+
+# -----------------------------------------------------------
+# Metrics
+# -----------------------------------------------------------
+records_counter = meter.create_counter("ingest_records_total")
+batch_size_histogram = meter.create_histogram("ingest_batch_size")
+commit_latency_histogram = meter.create_histogram("ingest_commit_latency_milliseconds")
+end_to_end_latency_histogram = meter.create_histogram("ingest_end_to_end_latency_seconds")
+error_counter = meter.create_counter("ingest_errors_total")
+skipped_counter = meter.create_counter("ingest_skipped_records_total")
+
+# Dialects whose insert() supports multi-row VALUES + ON CONFLICT DO UPDATE
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
+# Errors caused by the row itself (bad encoding, constraint violation): retrying the
+# batch can never succeed. Anything else (connection lost, DB down) is retried.
+# ValueError covers drivers rejecting a value before sending it (e.g. psycopg2 on NUL).
+_ROW_ERRORS = (DataError, IntegrityError, ValueError)
+
+
+def _strip_nul(value):
+    # Postgres text columns cannot store NUL characters
+    return value.replace("\x00", "") if isinstance(value, str) else value
+
+
+def record_to_item(msg) -> Dict[str, Any]:
+    """Map a Kafka record (as produced by fastapi-msc-kafka) to an items row.
+
+    Raw values are JSON-decoded here rather than in the consumer's value_deserializer,
+    so a bad record raises ValueError for that record only instead of failing the poll.
+    """
+    value = msg.value
+    if isinstance(value, (bytes, bytearray)):
+        # UnicodeDecodeError and JSONDecodeError are both ValueError
+        value = json.loads(value.decode("utf-8"))
+    if isinstance(value, dict):
+        value = value.get("value")
+    if value is not None and not isinstance(value, str):
+        value = json.dumps(value)
+
+    return {
+        "name": _strip_nul(safe_decode(msg.key)) or msg.topic,
+        "description": _strip_nul(value),
+        "source": f"{msg.topic}-{msg.partition}-{msg.offset}",
+    }
+
+
+def upsert_items(db: Session, rows: List[Dict[str, Any]]):
+    """Write rows with a single multi-row INSERT ... ON CONFLICT (source) DO UPDATE and commit."""
+    dialect = db.get_bind().dialect.name
+    if dialect not in _UPSERT_INSERTS:
+        raise NotImplementedError(f"Upsert not supported for dialect {dialect}")
+
+    table = models.Item.__table__
+    stmt = _UPSERT_INSERTS[dialect](table).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[table.c.source],
+        set_={"name": stmt.excluded.name, "description": stmt.excluded.description},
+    )
+    db.execute(stmt)
+    db.commit()
+
+
+# ===========================================================
+# KAFKA -> POSTGRES PIPELINE
+# ===========================================================
+class IngestionPipeline:
+    """Consume a topic in micro-batches and upsert them into the items table.
+
+    Offsets are committed only after the DB transaction commits (at-least-once);
+    re-delivered records hit the unique ``source`` column and are upserted.
+    A batch rejected because of its rows is written again one row at a time, and
+    the rows the DB rejects are skipped so a single bad record cannot stall the partition.
+    """
+
+    def __init__(
+        self,
+        consumer: MonitoredConsumer,
+        session_factory=SessionLocal,
+        batch_size: int = 500,
+        linger_ms: int = 200,
+        retry_backoff_ms: int = 1000,
+    ):
+        self._consumer = consumer
+        self._session_factory = session_factory
+        self.batch_size = batch_size
+        self.linger_ms = linger_ms
+        self.retry_backoff_ms = retry_backoff_ms
+        self._running = False
+
+    async def run(self):
+        self._running = True
+        LOG.info("Ingestion started: batch_size=%s linger_ms=%s", self.batch_size, self.linger_ms)
+
+        while self._running:
+            batches = {}
+            try:
+                batches = await self._consumer.getmany(timeout_ms=self.linger_ms, max_records=self.batch_size)
+                batches = {tp: msgs for tp, msgs in batches.items() if msgs}
+                if batches:
+                    await self.process_batch(batches)
+            except Exception as e:
+                LOG.exception("Poll or batch failed, rewinding to last committed offsets")
+                error_counter.add(1, {"stage": "batch" if batches else "poll", "error_type": type(e).__name__})
+                self._rewind(batches)
+                await asyncio.sleep(self.retry_backoff_ms / 1000)
+
+        LOG.info("Ingestion stopped")
+
+    def stop(self):
+        self._running = False
+
+    def _rewind(self, batches):
+        """Nothing was committed: re-read the batch on the next poll, for partitions we still own."""
+        assigned = self._consumer.assignment()
+        for tp, msgs in batches.items():
+            # A rebalance may have revoked it; the new owner resumes from the committed offset
+            if tp in assigned:
+                self._consumer.seek(tp, msgs[0].offset)
+
+    async def process_batch(self, batches):
+        messages = [msg for msgs in batches.values() for msg in msgs]
+        topic = messages[0].topic
+        attrs = {"topic": topic}
+
+        rows = []
+        for msg in messages:
+            try:
+                rows.append(record_to_item(msg))
+            except ValueError as e:
+                # Poison record: skip it, its offset is committed with the rest of the batch
+                LOG.warning("Skipping undecodable record %s-%s-%s: %s", msg.topic, msg.partition, msg.offset, e)
+                skipped_counter.add(1, {**attrs, "error_type": type(e).__name__})
+        written = len(rows)
+
+        # Producer trace context: parent on the first record, link every record
+        producer_contexts = []
+        for msg in messages:
+            incoming_headers = {safe_decode(k): safe_decode(v) for k, v in (msg.headers or [])}
+            try:
+                parent_context = propagator.extract(incoming_headers)
+            except Exception:
+                continue
+            if trace.get_current_span(parent_context).get_span_context().is_valid:
+                producer_contexts.append(parent_context)
+
+        span_ctx_kwargs = {"context": producer_contexts[0]} if producer_contexts else {}
+        links = [trace.Link(trace.get_current_span(ctx).get_span_context()) for ctx in producer_contexts]
+
+        with tracer.start_as_current_span(
+            f"{topic} ingest",
+            kind=trace.SpanKind.CONSUMER,
+            links=links,
+            attributes={
+                SpanAttributes.MESSAGING_SYSTEM: "kafka",
+                SpanAttributes.MESSAGING_DESTINATION: topic,
+                SpanAttributes.MESSAGING_OPERATION: "process",
+                SpanAttributes.MESSAGING_BATCH_MESSAGE_COUNT: len(messages),
+            },
+            **span_ctx_kwargs,
+        ) as span:
+            try:
+                # DB write runs in a thread (sync SQLAlchemy); to_thread keeps this span as parent
+                if rows:
+                    start_time = time.perf_counter()
+                    try:
+                        await asyncio.to_thread(self._write, rows)
+                    except _ROW_ERRORS as e:
+                        LOG.warning("Batch rejected (%s), writing its %s rows one by one", type(e).__name__, len(rows))
+                        written = await asyncio.to_thread(self._write_rows, rows, attrs)
+                    commit_latency_histogram.record((time.perf_counter() - start_time) * 1000, {**attrs, "stage": "db"})
+
+                # Offsets are committed only once the rows are durable
+                start_time = time.perf_counter()
+                await self._consumer.commit({tp: msgs[-1].offset + 1 for tp, msgs in batches.items()})
+                commit_latency_histogram.record((time.perf_counter() - start_time) * 1000, {**attrs, "stage": "kafka"})
+
+            except Exception as e:
+                span.set_status(trace.Status(trace.StatusCode.ERROR, str(e)))
+                raise
+
+        records_counter.add(written, attrs)
+        batch_size_histogram.record(len(messages), attrs)
+
+        now_ms = time.time() * 1000
+        for msg in messages:
+            end_to_end_latency_histogram.record(max(0, (now_ms - msg.timestamp) / 1000), attrs)
+
+        LOG.debug("Ingested batch of %s records", len(messages))
+
+    def _write(self, rows):
+        db = self._session_factory()
+        try:
+            upsert_items(db, rows)
+        except Exception:
+            db.rollback()
+            raise
+        finally:
+            db.close()
+
+    def _write_rows(self, rows, attrs) -> int:
+        """Write each row in its own transaction, skipping the rows the DB rejects."""
+        written = 0
+        for row in rows:
+            try:
+                self._write([row])
+            except _ROW_ERRORS as e:
+                # Row-level error: skip it, its offset is committed with the rest of the batch
+                LOG.warning("Skipping record %s rejected by the DB: %s", row["source"], e)
+                skipped_counter.add(1, {**attrs, "error_type": type(e).__name__})
+            else:
+                written += 1
+        return written
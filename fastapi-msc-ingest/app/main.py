@@ -0,0 +1,69 @@
+import asyncio
+import logging
+import os
+
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from aiokafka import AIOKafkaConsumer
+
+from database import init_db
+from ingest import IngestionPipeline
+from kafka_metrics import MonitoredConsumer
+
+app = FastAPI(title="Kafka to Postgres ingestion")
+
+logging.basicConfig(level=logging.INFO)
+LOG = logging.getLogger("fastapi-msc-ingest")
+
+KAFKA_BOOTSTRAP_SERVERS = os.getenv("KAFKA_BOOTSTRAP_SERVERS", "kafka-service.applications.svc.cluster.local:9092")
+TOPIC_NAME = os.getenv("INGEST_TOPIC", "test-topic")
+GROUP_ID = os.getenv("INGEST_GROUP_ID", "fastapi-msc-ingest")
+BATCH_SIZE = int(os.getenv("INGEST_BATCH_SIZE", "500"))
+LINGER_MS = int(os.getenv("INGEST_LINGER_MS", "200"))
+
+consumer: MonitoredConsumer | None = None
+pipeline: IngestionPipeline | None = None
+pipeline_task: asyncio.Task | None = None
+
+
+@app.on_event("startup")
+async def startup_event():
+    global consumer, pipeline, pipeline_task
+    # Create the items table, or add the unique "source" column to an existing one
+    await asyncio.to_thread(init_db)
+
+    raw_consumer = AIOKafkaConsumer(
+        TOPIC_NAME,
+        bootstrap_servers=KAFKA_BOOTSTRAP_SERVERS,
+        client_id="fastapi-msc-ingest",
+        group_id=GROUP_ID,
+        auto_offset_reset="earliest",
+        # Values are JSON-decoded per record by the pipeline (bad records are skipped, not fatal).
+        # Offsets are committed by the pipeline, after the DB transaction commits
+        enable_auto_commit=False,
+    )
+    consumer = MonitoredConsumer(raw_consumer)
+    await consumer.start()
+
+    pipeline = IngestionPipeline(consumer, batch_size=BATCH_SIZE, linger_ms=LINGER_MS)
+    pipeline_task = asyncio.create_task(pipeline.run())
+    LOG.info("✅ Ingestion pipeline started (%s -> items)", TOPIC_NAME)
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if pipeline:
+        # Let the in-flight batch finish (DB + offset commit) before leaving the group
+        pipeline.stop()
+        await pipeline_task
+    if consumer:
+        await consumer.stop()
+        LOG.info("🛑 Ingestion pipeline stopped")
+
+
+@app.get("/health")
+async def health():
+    running = pipeline_task is not None and not pipeline_task.done()
+    content = {"status": "ok" if running else "stopped", "topic": TOPIC_NAME, "group_id": GROUP_ID}
+    # 503 lets the liveness probe restart the pod if the pipeline task died
+    return JSONResponse(status_code=200 if running else 503, content=content)
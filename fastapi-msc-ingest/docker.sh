@@ -0,0 +1,10 @@
+#!/bin/bash
+clear
+cd "$(dirname "$0")/.."
+docker container stop fastapi-ingest
+docker container remove fastapi-ingest
+docker build --no-cache  --tag fastapi-msc-ingest:1.0 -f fastapi-msc-ingest/Dockerfile .
+docker run -d -p 8005:8001 \
+    --name fastapi-ingest \
+    --network=mynet \
+    -t fastapi-msc-ingest:1.0
@@ -0,0 +1,7 @@
+#!/bin/bash
+docker image remove fastapi-msc-ingest:1.0
+kubectl delete -n applications deployments.apps fastapi-msc-ingest-deployment
+docker build --no-cache  --tag fastapi-msc-ingest:1.0 -f Dockerfile ..
+kind load docker-image fastapi-msc-ingest:1.0
+kubectl apply -f k8s.yaml
+kubectl logs deployments/fastapi-msc-ingest-deployment -n applications -f
@@ -0,0 +1,199 @@
+"""Kafka -> Postgres ingestion benchmark with local stand-ins.
+
+Kafka is replaced by an in-memory single-partition topic and Postgres by a
+SQLite file; the pipeline, the multi-row upsert and the OTel metrics are the
+real ones. Two poison records are mixed in: one that is not JSON and one the DB
+rejects; both must be skipped and committed past. Run from this directory:
+
+    pip install -r ../app/requirements.txt
+    python benchmark.py --records 20000 --batch-sizes 1 50 500
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+for app_dir in ("fastapi-msc-ingest", "fastapi-msc-kafka", "fastapi-msc-db"):
+    sys.path.insert(0, os.path.join(HERE, "..", "..", app_dir, "app"))
+
+# Stand-in Postgres: must be set before database.py creates the engine
+DB_FILE = os.path.join(tempfile.mkdtemp(), "ingest-benchmark.db")
+os.environ["DATABASE_URL"] = f"sqlite:///{DB_FILE}"
+
+from opentelemetry import metrics  # noqa: E402
+from opentelemetry.sdk.metrics import Counter, Histogram, MeterProvider  # noqa: E402
+from opentelemetry.sdk.metrics.export import AggregationTemporality, InMemoryMetricReader  # noqa: E402
+
+# Delta temporality: every read only covers what happened since the previous one
+metric_reader = InMemoryMetricReader(preferred_temporality={
+    Counter: AggregationTemporality.DELTA,
+    Histogram: AggregationTemporality.DELTA,
+})
+metrics.set_meter_provider(MeterProvider(metric_readers=[metric_reader]))
+
+from aiokafka.structs import ConsumerRecord, TopicPartition  # noqa: E402
+
+import models  # noqa: E402
+from database import SessionLocal, engine  # noqa: E402
+from ingest import IngestionPipeline  # noqa: E402
+from kafka_metrics import MonitoredConsumer  # noqa: E402
+
+TOPIC = "test-topic"
+
+
+# -----------------------------------------------------------
+# Stand-in Kafka
+# -----------------------------------------------------------
+class LocalTopicConsumer:
+    """Minimal AIOKafkaConsumer stand-in over a pre-filled single-partition topic."""
+
+    def __init__(self, records):
+        self._tp = TopicPartition(TOPIC, 0)
+        self._records = records
+        self._position = 0
+        self._group_id = "ingest-benchmark"
+        self.committed = {}
+
+    async def start(self):
+        pass
+
+    async def stop(self):
+        pass
+
+    async def getmany(self, timeout_ms=0, max_records=None):
+        if self._position >= len(self._records):
+            await asyncio.sleep(timeout_ms / 1000)
+            return {}
+        end = self._position + (max_records or len(self._records))
+        chunk = self._records[self._position:end]
+        self._position += len(chunk)
+        return {self._tp: chunk}
+
+    def assignment(self):
+        return {self._tp}
+
+    def seek(self, tp, offset):
+        self._position = offset
+
+    async def commit(self, offsets):
+        self.committed.update(offsets)
+
+
+def make_records(n, payload_size):
+    now_ms = int(time.time() * 1000)
+    poison = {
+        n // 3: b"not json",
+        # Valid JSON, but a lone surrogate cannot be encoded by the DB driver (UnicodeEncodeError)
+        2 * n // 3: json.dumps({"value": "\ud800"}).encode("utf-8"),
+    }
+    records = []
+    for offset in range(n):
+        traceparent = f"00-{random.getrandbits(128):032x}-{random.getrandbits(64):016x}-01"
+        value = poison.get(offset) or json.dumps({"value": "x" * payload_size}).encode("utf-8")
+        records.append(ConsumerRecord(
+            topic=TOPIC,
+            partition=0,
+            offset=offset,
+            timestamp=now_ms,
+            timestamp_type=0,
+            key=f"user{offset % 100}".encode("utf-8"),
+            value=value,
+            checksum=None,
+            serialized_key_size=-1,
+            serialized_value_size=len(value),
+            headers=(("traceparent", traceparent.encode("utf-8")),),
+        ))
+    return records, len(poison)
+
+
+# -----------------------------------------------------------
+# Helpers
+# -----------------------------------------------------------
+def read_metrics():
+    """Mean of each ingest histogram (per stage) and total of each counter since the previous call."""
+    values = {}
+    data = metric_reader.get_metrics_data()
+    if data is None:
+        return values
+    for resource_metrics in data.resource_metrics:
+        for scope_metrics in resource_metrics.scope_metrics:
+            for metric in scope_metrics.metrics:
+                if not metric.name.startswith("ingest_"):
+                    continue
+                for point in metric.data.data_points:
+                    if not hasattr(point, "sum"):
+                        values[metric.name] = values.get(metric.name, 0) + point.value
+                        continue
+                    stage = point.attributes.get("stage")
+                    name = f"{metric.name}[{stage}]" if stage else metric.name
+                    values[name] = point.sum / point.count if point.count else 0
+    return values
+
+
+def count_items():
+    db = SessionLocal()
+    try:
+        return db.query(models.Item).count()
+    finally:
+        db.close()
+
+
+async def ingest(records, batch_size):
+    consumer = LocalTopicConsumer(records)
+    pipeline = IngestionPipeline(MonitoredConsumer(consumer), batch_size=batch_size, linger_ms=10)
+    task = asyncio.create_task(pipeline.run())
+
+    start = time.perf_counter()
+    while consumer.committed.get(consumer._tp, 0) < len(records):
+        await asyncio.sleep(0.005)
+    elapsed = time.perf_counter() - start
+
+    pipeline.stop()
+    await task
+    return elapsed
+
+
+async def main(args):
+    print(f"records={args.records} payload={args.payload_size}B db={DB_FILE}")
+    print(
+        f"{'batch':>6} {'rec/s':>10} {'db commit ms':>13} {'kafka commit ms':>16} {'e2e s':>8} "
+        f"{'rows':>7} {'skipped':>8} {'replay':>7}"
+    )
+
+    for batch_size in args.batch_sizes:
+        models.Base.metadata.drop_all(bind=engine)
+        models.Base.metadata.create_all(bind=engine)
+        read_metrics()
+        # Fresh timestamps so end-to-end latency only covers this run
+        records, poisoned = make_records(args.records, args.payload_size)
+
+        # Returns once the offset past the last record (and so past the poison ones) is committed
+        elapsed = await ingest(records, batch_size)
+        rows = count_items()
+        values = read_metrics()
+        db_ms = values.get("ingest_commit_latency_milliseconds[db]", 0)
+        kafka_ms = values.get("ingest_commit_latency_milliseconds[kafka]", 0)
+        e2e_s = values.get("ingest_end_to_end_latency_seconds", 0)
+        skipped = values.get("ingest_skipped_records_total", 0)
+
+        # At-least-once: re-deliver the whole topic, the upsert must not duplicate rows
+        await ingest(records, batch_size)
+        replay_ok = count_items() == rows == len(records) - poisoned and skipped == poisoned
+
+        print(
+            f"{batch_size:>6} {len(records) / elapsed:>10.0f} {db_ms:>13.2f} {kafka_ms:>16.3f} "
+            f"{e2e_s:>8.2f} {rows:>7} {skipped:>8} {'ok' if replay_ok else 'FAIL':>7}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--records", type=int, default=20000)
+    parser.add_argument("--payload-size", type=int, default=1000)
+    parser.add_argument("--batch-sizes", type=int, nargs="+", default=[1, 50, 500])
+    asyncio.run(main(parser.parse_args()))
@@ -1,3 +1,4 @@
+import os
 import json
 import logging
 from fastapi import FastAPI, HTTPException
@@ -37,7 +38,7 @@ async def startup_event():
     # 2. Wrap it
     producer = MonitoredProducer(raw_producer)
     await producer.start()
-    LOG.info("✅ Kafka Producer started")
+    LOG.info("✅ Kafka Producer started (pid=%s)", os.getpid())
 
 
 @app.on_event("shutdown")
@@ -0,0 +1,73 @@
+import math
+import os
+import socket
+
+
+def _available_cpus() -> int:
+    """CPUs the container may use: the affinity mask capped by the cgroup CPU quota (k8s limits.cpu)."""
+    cpus = len(os.sched_getaffinity(0))
+    quota_files = (
+        ("/sys/fs/cgroup/cpu.max", None),  # cgroup v2: "<quota> <period>" or "max <period>"
+        ("/sys/fs/cgroup/cpu/cpu.cfs_quota_us", "/sys/fs/cgroup/cpu/cpu.cfs_period_us"),  # cgroup v1
+    )
+    for quota_file, period_file in quota_files:
+        try:
+            with open(quota_file) as f:
+                values = f.read().split()
+            if period_file:
+                with open(period_file) as f:
+                    values.append(f.read().strip())
+        except OSError:
+            continue
+        quota, period = values[0], values[1]
+        if quota not in ("max", "-1"):
+            cpus = min(cpus, math.ceil(int(quota) / int(period)))
+        break
+    return max(1, cpus)
+
+
+# -----------------------------------------------------------
+# Multi-worker (prefork) serving: gunicorn master + uvicorn workers
+# -----------------------------------------------------------
+# WEB_CONCURRENCY sets the number of worker processes (one core each).
+# Default: one per CPU allowed by the container CPU limit.
+bind = f"0.0.0.0:{os.getenv('PORT', '8001')}"
+workers = int(os.getenv("WEB_CONCURRENCY", _available_cpus()))
+worker_class = "uvicorn_worker.UvicornWorker"
+graceful_timeout = int(os.getenv("GRACEFUL_TIMEOUT", "30"))
+
+# Workload process pool size (see main.py): each worker's share of the available CPUs,
+# so /workload/* concurrency is actually parallel without oversubscribing the container.
+os.environ.setdefault("WORKLOAD_PROCESSES", str(max(1, _available_cpus() // workers)))
+
+# The app (and the meters it creates on import) must be
+# loaded in each worker after fork, never shared from the master.
+preload_app = False
+
+
+def post_fork(server, worker):
+    """Initialize OTel providers/exporters inside the worker, after fork.
+
+    Exporter threads and gRPC channels do not survive fork(), so the master
+    never initializes OTel; each worker does it here, before the app is imported.
+    """
+    instance_id = f"{socket.gethostname()}-{worker.pid}"
+    resource_attributes = os.getenv("OTEL_RESOURCE_ATTRIBUTES", "")
+    os.environ["OTEL_RESOURCE_ATTRIBUTES"] = ",".join(
+        attr for attr in (resource_attributes, f"service.instance.id={instance_id}") if attr
+    )
+
+    from opentelemetry.instrumentation.auto_instrumentation import initialize
+
+    initialize()
+    server.log.info("OTel initialized for worker %s", instance_id)
+
+
+def worker_exit(server, worker):
+    """Flush and shut down OTel providers when the worker exits."""
+    from opentelemetry import metrics, trace
+
+    for provider in (trace.get_tracer_provider(), metrics.get_meter_provider()):
+        shutdown = getattr(provider, "shutdown", None)
+        if shutdown:
+            shutdown()
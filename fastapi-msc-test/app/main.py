@@ -1,7 +1,15 @@
 import asyncio
+import multiprocessing
+import os
+import time
 import httpx
 import base64
 
+from contextlib import asynccontextmanager
+
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
 from fastapi import FastAPI, Query, Request, HTTPException
 from fastapi.responses import JSONResponse
 from fastapi import FastAPI
@@ -9,6 +17,7 @@ from random import randint
 
 from observability.config import setup_logging
 from observability.metrics import setup_metrics
+from workloads import cpu_burn, churn_memory
 
 # Initialize logging before the app starts
 logger = setup_logging()
@@ -18,6 +27,71 @@ app = FastAPI()
 # Attach the metrics middleware
 setup_metrics(app, "fastapi-msc-test")
 
+# CPU-bound workloads run here so the event loop stays responsive.
+# gunicorn.conf.py sets it to this worker's share of the container CPUs.
+WORKLOAD_PROCESSES = int(os.getenv("WORKLOAD_PROCESSES", "1"))
+# Pool tasks (running + queued) per worker; requests beyond it get 503 instead of piling up
+WORKLOAD_MAX_QUEUE = int(os.getenv("WORKLOAD_MAX_QUEUE", str(2 * WORKLOAD_PROCESSES)))
+# Upper bound for the peak memory of all pool processes on /workload/memory (pod memory limit is 1Gi)
+WORKLOAD_MAX_MEMORY_MB = int(os.getenv("WORKLOAD_MAX_MEMORY_MB", "256"))
+# A running task plus a queued one must finish within gunicorn's graceful_timeout (30s)
+WORKLOAD_MAX_DURATION_MS = 10000
+workload_pool: ProcessPoolExecutor | None = None
+workload_queued = 0
+
+
+def create_workload_pool() -> ProcessPoolExecutor:
+    # spawn, not fork: forking this process would copy the running OTel SDK
+    # (exporter threads restart in every child) and can deadlock on held locks
+    return ProcessPoolExecutor(max_workers=WORKLOAD_PROCESSES, mp_context=multiprocessing.get_context("spawn"))
+
+
+@app.on_event("startup")
+async def startup_event():
+    global workload_pool
+    workload_pool = create_workload_pool()
+    logger.info("Workload process pool started", extra={"processes": WORKLOAD_PROCESSES, "max_queue": WORKLOAD_MAX_QUEUE})
+
+
+@app.on_event("shutdown")
+async def shutdown_event():
+    if workload_pool:
+        # Waits for the running tasks (<= WORKLOAD_MAX_DURATION_MS) without blocking the event loop
+        await asyncio.to_thread(workload_pool.shutdown, wait=True, cancel_futures=True)
+        logger.info("Workload process pool stopped")
+
+
+async def run_in_pool(func, *args):
+    global workload_pool
+    pool = workload_pool
+    try:
+        return await asyncio.get_running_loop().run_in_executor(pool, func, *args)
+    except BrokenProcessPool:
+        # A pool process died (e.g. OOM killed): replace the pool once, fail this request
+        if workload_pool is pool:
+            logger.error("Workload process pool broken, recreating it")
+            workload_pool = create_workload_pool()
+            pool.shutdown(wait=False, cancel_futures=True)
+        raise HTTPException(status_code=503, detail="Workload process died, pool recreated")
+
+
+@asynccontextmanager
+async def workload_slots(tasks: int):
+    """Reserve room for `tasks` pool tasks, or fail fast with 503 when the queue is full."""
+    global workload_queued
+    if workload_queued + tasks > WORKLOAD_MAX_QUEUE:
+        raise HTTPException(
+            status_code=503,
+            detail=f"Workload queue full ({workload_queued}/{WORKLOAD_MAX_QUEUE} tasks)",
+            headers={"Retry-After": "1"},
+        )
+    workload_queued += tasks
+    try:
+        yield
+    finally:
+        workload_queued -= tasks
+
+
 @app.get("/slow")
 async def slow(timeDelay: int | None = Query(default=5)):
     await asyncio.sleep(timeDelay / 1000)
@@ -67,4 +141,77 @@ async def call_loop(loop: int | None = Query(default=1)):
         "called_url": url,
         "remote_status": response.status_code,
         "remote_response": response.text,
-    }
\ No newline at end of file
+    }
+
+
+@app.get("/workload/cpu")
+async def workload_cpu(
+    duration_ms: int = Query(default=500, ge=1, le=WORKLOAD_MAX_DURATION_MS),
+    concurrency: int = Query(default=1, ge=1, le=64),
+):
+    # Parallel tasks: no more than the pool can run at once
+    concurrency = min(concurrency, WORKLOAD_PROCESSES)
+
+    start = time.perf_counter()
+    async with workload_slots(concurrency):
+        iterations = await asyncio.gather(*(run_in_pool(cpu_burn, duration_ms) for _ in range(concurrency)))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    logger.info("CPU workload complete", extra={"duration_ms": duration_ms, "concurrency": concurrency, "elapsed_ms": elapsed_ms})
+    return {"workload": "cpu", "concurrency": concurrency, "iterations": sum(iterations), "elapsed_ms": round(elapsed_ms, 1)}
+
+@app.get("/workload/memory")
+async def workload_memory(
+    duration_ms: int = Query(default=500, ge=1, le=WORKLOAD_MAX_DURATION_MS),
+    concurrency: int = Query(default=1, ge=1, le=64),
+    chunk_kb: int = Query(default=256, ge=1, le=65536),
+    live_mb: int = Query(default=64, ge=1, le=1024),
+):
+    concurrency = min(concurrency, WORKLOAD_PROCESSES)
+    # A task peaks at live_mb plus the chunk being allocated, and every pool process may
+    # run one (from this or another request), whatever this request's concurrency
+    peak_mb = WORKLOAD_PROCESSES * (live_mb + chunk_kb / 1024)
+    if peak_mb > WORKLOAD_MAX_MEMORY_MB:
+        raise HTTPException(
+            status_code=422,
+            detail=f"{WORKLOAD_PROCESSES} processes x (live_mb + chunk_kb / 1024) must be <= {WORKLOAD_MAX_MEMORY_MB} MB",
+        )
+
+    start = time.perf_counter()
+    async with workload_slots(concurrency):
+        results = await asyncio.gather(
+            *(run_in_pool(churn_memory, duration_ms, chunk_kb, live_mb) for _ in range(concurrency))
+        )
+    elapsed_ms = (time.perf_counter() - start) * 1000
+    allocated_mb = sum(r["allocated_mb"] for r in results)
+
+    logger.info("Memory workload complete", extra={"duration_ms": duration_ms, "concurrency": concurrency, "allocated_mb": allocated_mb})
+    return {"workload": "memory", "concurrency": concurrency, "allocated_mb": round(allocated_mb, 1), "elapsed_ms": round(elapsed_ms, 1)}
+
+@app.get("/workload/mixed")
+async def workload_mixed(
+    duration_ms: int = Query(default=1000, ge=1, le=WORKLOAD_MAX_DURATION_MS),
+    concurrency: int = Query(default=1, ge=1, le=64),
+    io_ms: int = Query(default=20, ge=0, le=1000),
+    cpu_ms: int = Query(default=20, ge=1, le=1000),
+):
+    # Each loop has at most one CPU burst in the pool at a time
+    concurrency = min(concurrency, WORKLOAD_PROCESSES)
+
+    async def io_cpu_loop():
+        # Alternate awaited IO (sleep) and pooled CPU bursts until the deadline
+        deadline = time.perf_counter() + duration_ms / 1000
+        cycles = 0
+        while time.perf_counter() < deadline:
+            await asyncio.sleep(io_ms / 1000)
+            await run_in_pool(cpu_burn, cpu_ms)
+            cycles += 1
+        return cycles
+
+    start = time.perf_counter()
+    async with workload_slots(concurrency):
+        cycles = await asyncio.gather(*(io_cpu_loop() for _ in range(concurrency)))
+    elapsed_ms = (time.perf_counter() - start) * 1000
+
+    logger.info("Mixed workload complete", extra={"duration_ms": duration_ms, "concurrency": concurrency, "cycles": sum(cycles)})
+    return {"workload": "mixed", "concurrency": concurrency, "cycles": sum(cycles), "elapsed_ms": round(elapsed_ms, 1)}
@@ -0,0 +1,47 @@
+import hashlib
+import os
+import time
+from collections import deque
+
+# -----------------------------------------------------------
+# Synthetic workloads
+# -----------------------------------------------------------
+# Plain functions, no OTel/logging: they run inside ProcessPoolExecutor
+# workers, so they must stay picklable and cheap to import.
+
+
+def cpu_burn(duration_ms: int) -> int:
+    """Hash a buffer in a tight loop for duration_ms; returns the number of iterations."""
+    deadline = time.perf_counter() + duration_ms / 1000
+    digest = os.urandom(64)
+    iterations = 0
+    while time.perf_counter() < deadline:
+        for _ in range(1000):
+            digest = hashlib.sha256(digest).digest()
+        iterations += 1000
+    return iterations
+
+
+def churn_memory(duration_ms: int, chunk_kb: int, live_mb: int) -> dict:
+    """Allocate and free chunk_kb buffers for duration_ms, keeping up to live_mb alive.
+
+    The live window keeps the resident set up while the oldest chunks are
+    released, so allocator and page-fault churn show up on the dashboards.
+    """
+    deadline = time.perf_counter() + duration_ms / 1000
+    chunk_size = chunk_kb * 1024
+    max_live = max(1, (live_mb * 1024 * 1024) // chunk_size)
+    live = deque()
+    allocated = 0
+    while time.perf_counter() < deadline:
+        chunk = bytearray(chunk_size)
+        # touch every page so the memory is actually committed
+        chunk[::4096] = b"\x01" * len(range(0, chunk_size, 4096))
+        live.append(chunk)
+        allocated += 1
+        if len(live) > max_live:
+            live.popleft()
+    return {
+        "allocated_mb": round(allocated * chunk_size / (1024 * 1024), 1),
+        "live_mb": round(len(live) * chunk_size / (1024 * 1024), 1),
+    }
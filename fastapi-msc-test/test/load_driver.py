@@ -0,0 +1,176 @@
+"""Python load driver (replaces the hey scripts) with HDR-style latency percentiles.
+
+Same flags as hey where it makes sense:
+
+    python load_driver.py -n 20000 -c 100 http://localhost:8001/rolldice
+    python load_driver.py -z 60s -c 20 -q 5 "http://localhost:8001/workload/cpu?duration_ms=200"
+    python load_driver.py -n 1000 -c 10 -m POST -H "Content-Type: application/json" -d '{"key":"k","value":"v"}' URL
+
+With -q (rate limit), latency is measured from the *scheduled* send time, so a
+stalled server is not hidden by the client backing off (coordinated omission).
+
+Single process: the client is bound to one core, so it is meant for latency under a
+given load, not for finding peak throughput (use hey, see worker-scaling-test.sh).
+"""
+import argparse
+import asyncio
+import math
+import sys
+import time
+from array import array
+from collections import Counter
+
+import httpx
+
+PERCENTILES = (50, 75, 90, 95, 99, 99.9, 99.99, 100)
+
+
+# -----------------------------------------------------------
+# Latency recording
+# -----------------------------------------------------------
+class LatencyRecorder:
+    """Records every latency (microseconds) and reports exact percentiles."""
+
+    def __init__(self):
+        self._values = array("d")
+
+    def record(self, seconds: float):
+        self._values.append(seconds * 1_000_000)
+
+    def __len__(self):
+        return len(self._values)
+
+    def percentiles(self, ps=PERCENTILES):
+        values = sorted(self._values)
+        if not values:
+            return {p: 0.0 for p in ps}
+        # nearest-rank, as HdrHistogram reports it
+        return {p: values[max(1, math.ceil(p / 100 * len(values))) - 1] for p in ps}
+
+    def mean(self) -> float:
+        return sum(self._values) / len(self._values) if self._values else 0.0
+
+    def stddev(self) -> float:
+        if len(self._values) < 2:
+            return 0.0
+        mean = self.mean()
+        return math.sqrt(sum((v - mean) ** 2 for v in self._values) / len(self._values))
+
+
+# -----------------------------------------------------------
+# Load generation
+# -----------------------------------------------------------
+def parse_header(value: str):
+    """Parse a 'Name: value' header."""
+    name, sep, header_value = value.partition(":")
+    if not sep or not name.strip():
+        raise argparse.ArgumentTypeError(f"invalid header {value!r}, expected 'Name: value'")
+    return name.strip(), header_value.strip()
+
+
+def parse_duration(value: str) -> float:
+    """Parse hey-style durations: 30s, 5m, 1h (plain numbers are seconds)."""
+    units = {"s": 1, "m": 60, "h": 3600}
+    number, unit = (value[:-1], value[-1]) if value[-1:] in units else (value, "s")
+    try:
+        seconds = float(number) * units[unit]
+    except ValueError:
+        seconds = math.nan
+    if not seconds > 0 or math.isinf(seconds):
+        raise argparse.ArgumentTypeError(f"invalid duration {value!r}, expected e.g. 30s, 5m, 1h")
+    return seconds
+
+
+async def worker(client, args, recorder, statuses, errors, budget, deadline):
+    interval = 1 / args.rate if args.rate else 0
+    next_send = time.perf_counter()
+
+    while True:
+        if deadline and time.perf_counter() >= deadline:
+            return
+        if budget is not None:
+            if budget[0] <= 0:
+                return
+            budget[0] -= 1
+
+        if interval:
+            delay = next_send - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            scheduled = next_send
+            next_send += interval
+        else:
+            scheduled = time.perf_counter()
+
+        try:
+            response = await client.request(args.method, args.url, headers=args.headers, content=args.body)
+            statuses[response.status_code] += 1
+        except (httpx.HTTPError, httpx.InvalidURL) as e:
+            errors[type(e).__name__] += 1
+        recorder.record(time.perf_counter() - scheduled)
+
+
+async def run(args):
+    recorder = LatencyRecorder()
+    statuses = Counter()
+    errors = Counter()
+    budget = [args.requests] if not args.duration else None
+
+    limits = httpx.Limits(max_connections=args.concurrency, max_keepalive_connections=args.concurrency)
+    timeout = httpx.Timeout(args.timeout)
+    async with httpx.AsyncClient(limits=limits, timeout=timeout, http2=args.http2) as client:
+        start = time.perf_counter()
+        deadline = start + args.duration if args.duration else None
+        await asyncio.gather(*(
+            worker(client, args, recorder, statuses, errors, budget, deadline)
+            for _ in range(args.concurrency)
+        ))
+        elapsed = time.perf_counter() - start
+
+    report(args, recorder, statuses, errors, elapsed)
+    return 0 if not errors else 1
+
+
+def report(args, recorder, statuses, errors, elapsed):
+    total = len(recorder)
+    print(f"\nSummary: {args.method} {args.url}")
+    print(f"  Total:        {elapsed:.4f} secs")
+    print(f"  Requests:     {total}")
+    print(f"  Requests/sec: {total / elapsed if elapsed else 0:.2f}")
+    print(f"  Mean:         {recorder.mean() / 1000:.3f} ms (stddev {recorder.stddev() / 1000:.3f} ms)")
+
+    print("\nLatency percentiles (ms):")
+    for p, value in recorder.percentiles().items():
+        label = "max" if p == 100 else f"p{p:g}"
+        print(f"  {label:>8}  {value / 1000:10.3f}")
+
+    print("\nStatus code distribution:")
+    for code, count in sorted(statuses.items()):
+        print(f"  [{code}] {count} responses")
+
+    if errors:
+        print("\nErrors:")
+        for name, count in errors.most_common():
+            print(f"  [{name}] {count}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("url")
+    parser.add_argument("-n", dest="requests", type=int, default=200, help="number of requests (ignored with -z)")
+    parser.add_argument("-c", dest="concurrency", type=int, default=50, help="number of concurrent workers")
+    parser.add_argument("-q", dest="rate", type=float, default=0, help="rate limit per worker, in requests/sec")
+    parser.add_argument("-z", dest="duration", type=parse_duration, default=None, help="duration, e.g. 30s, 5m")
+    parser.add_argument("-m", dest="method", default="GET")
+    parser.add_argument("-H", dest="headers", type=parse_header, action="append", default=[], help="header, e.g. 'Accept: text/html'")
+    parser.add_argument("-d", dest="body", default=None, help="request body")
+    parser.add_argument("-t", dest="timeout", type=float, default=20, help="request timeout in seconds")
+    parser.add_argument("--http2", action="store_true")
+    args = parser.parse_args(argv)
+
+    args.headers = dict(args.headers)
+    return asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,39 @@
+#!/usr/bin/env bash
+# Drives the synthetic workload endpoints in parallel (CPU burn, allocation churn,
+# mixed IO/CPU + a cheap baseline) so the LGTM dashboards and the HPA see
+# realistic CPU and memory pressure. Each run prints its latency percentiles.
+set -e
+
+BASE_URL="${BASE_URL:-http://localhost/fastapi}"
+DURATION="${DURATION:-5m}"
+DRIVER="$(dirname "$0")/load_driver.py"
+OUT="$(mktemp -d)"
+
+# Rates (-q is per driver worker) are sized for one pod: limits.cpu 500m, one gunicorn
+# worker with one pool process, so about 0.5 CPU in total and no queued workload.
+# Above that, /workload/* answers 503 (queue full) rather than piling up requests.
+
+echo "Starting parallel workload test for ${DURATION}..."
+echo "Target: ${BASE_URL}"
+echo "============================================="
+
+# /rolldice – baseline throughput
+python "$DRIVER" -z "$DURATION" -q 20 -c 5 "${BASE_URL}/rolldice?player=load" > "$OUT/rolldice.txt" &
+
+# /workload/cpu – process pool CPU burn (1 req/s x 200ms)
+python "$DRIVER" -z "$DURATION" -q 0.5 -c 2 "${BASE_URL}/workload/cpu?duration_ms=200" > "$OUT/cpu.txt" &
+
+# /workload/memory – allocation churn (1 req / 5s x 500ms)
+python "$DRIVER" -z "$DURATION" -q 0.2 -c 1 "${BASE_URL}/workload/memory?duration_ms=500&chunk_kb=512&live_mb=128" > "$OUT/memory.txt" &
+
+# /workload/mixed – IO waits interleaved with CPU bursts (1 req / 5s x 1s, half of it CPU)
+python "$DRIVER" -z "$DURATION" -q 0.1 -c 2 "${BASE_URL}/workload/mixed?duration_ms=1000&io_ms=20&cpu_ms=20" > "$OUT/mixed.txt" &
+
+wait
+
+for f in rolldice cpu memory mixed; do
+  echo "================ ${f} ================"
+  cat "$OUT/${f}.txt"
+done
+
+echo "Workload test completed."
@@ -0,0 +1,35 @@
+#!/usr/bin/env bash
+# Runs the same hey load against fastapi-msc-test with 1, 2, 4... workers,
+# pinning the container to the same number of cores, and prints req/s per run.
+# Throughput should grow roughly linearly with the number of workers.
+clear
+set -e
+
+GREEN="\033[0;32m"
+NC="\033[0m"
+
+WORKERS="${WORKERS:-1 2 4}"
+DURATION="${DURATION:-30s}"
+CONCURRENCY="${CONCURRENCY:-100}"
+URL="http://localhost:8001/rolldice?player=load"
+
+docker build --tag fastapi-msc-test:latest "$(dirname "$0")/.."
+
+for n in $WORKERS; do
+  docker container rm -f fastapi-scaling >/dev/null 2>&1 || true
+  docker run -d -p 8001:8001 \
+    --name fastapi-scaling \
+    --cpus="$n" \
+    -e WEB_CONCURRENCY="$n" \
+    -e OTEL_TRACES_EXPORTER=none \
+    -e OTEL_METRICS_EXPORTER=none \
+    -t fastapi-msc-test:latest >/dev/null
+  sleep 5
+
+  echo -e "${GREEN}${n} worker(s) / ${n} core(s)${NC}"
+  # hey (Go, multi-core) rather than load_driver.py: a single-process Python client
+  # would hit its own CPU ceiling before several uvicorn workers saturate
+  hey -z "$DURATION" -c "$CONCURRENCY" "$URL" | grep -E "Requests/sec|99%"
+done
+
+docker container rm -f fastapi-scaling >/dev/null